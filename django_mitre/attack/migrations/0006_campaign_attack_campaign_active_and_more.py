@@ -0,0 +1,77 @@
+# Generated by Django 5.2.17 on 2026-08-30 11:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mitreattack', '0005_auto_20240606_0143'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='attack_campaign_active',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='datasource',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='attack_datasource_active',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='group',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='attack_group_active',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='matrix',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='attack_matrix_active',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='mitigation',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='attack_mitigation_active',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='software',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='attack_software_active',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='tactic',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='attack_tactic_active',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='technique',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='attack_technique_active',
+            ),
+        ),
+    ]
@@ -6,7 +6,7 @@ from django.db import models
 from django.db.models.signals import pre_save
 from django.dispatch import receiver
 
-from ..core.models import MitreIdentifiableMixIn
+from ..core.models import MitreIdentifiableMixIn, active_partial_index
 
 
 __all__ = (
@@ -117,6 +117,9 @@ class Group(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
     stix_data_types = ("intrusion-set",)
     aliases = models.JSONField(blank=True, null=True)
 
+    class Meta:
+        indexes = [active_partial_index("attack_group_active")]
+
 
 class Software(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
     """Software in Mitre Att&ck and Malware in STIX 2.1
@@ -144,6 +147,7 @@ class Software(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
 
     class Meta:
         verbose_name_plural = "software"
+        indexes = [active_partial_index("attack_software_active")]
 
 
 class Technique(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
@@ -179,6 +183,9 @@ class Technique(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
     # data_sources = models.ManyToManyField('DataSource')
     data_sources = models.JSONField(null=True, blank=True)
 
+    class Meta:
+        indexes = [active_partial_index("attack_technique_active")]
+
 
 class DataSource(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
     """Data Source in Mitre Att&ck
@@ -193,6 +200,9 @@ class DataSource(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
     version = models.CharField(max_length=16)
     contributors = models.JSONField(null=True, blank=True)
 
+    class Meta:
+        indexes = [active_partial_index("attack_datasource_active")]
+
 
 class DataComponent(BaseModel, DescriptiveMixIn):
     """Data Source in Mitre Att&ck even through it's classified as a component
@@ -214,6 +224,9 @@ class Mitigation(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
 
     stix_data_types = ("course-of-action",)
 
+    class Meta:
+        indexes = [active_partial_index("attack_mitigation_active")]
+
 
 class Reference(BaseModel):
     """Reference in Mitre Att&ck and Relationship in STIX 2.1
@@ -264,6 +277,7 @@ class Matrix(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
 
     class Meta:
         verbose_name_plural = "matrices"
+        indexes = [active_partial_index("attack_matrix_active")]
 
 
 class Tactic(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
@@ -297,6 +311,9 @@ class Tactic(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
     def __str__(self):
         return f"{self.name} (within {self.collection.name})"
 
+    class Meta:
+        indexes = [active_partial_index("attack_tactic_active")]
+
 
 class Identity(BaseModel):
     """Identity in STIX 2.1
@@ -324,6 +341,9 @@ class Campaign(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
     last_seen = models.DateTimeField()
     last_seen_citation = models.CharField(max_length=255)
 
+    class Meta:
+        indexes = [active_partial_index("attack_campaign_active")]
+
 
 ALL_MODELS = (
     Campaign,
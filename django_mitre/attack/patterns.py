@@ -28,37 +28,40 @@ app_label = "mitreattack"
 # However, they are written for case exact matching in view url registration,
 # because we don't absolutely know that MITRE won't change to a character
 # case-sensitive identifier scheme.
+# Identifiers are ASCII-only, so `re.A` is set to keep the
+# case-insensitive matching on the ASCII tables rather than the full
+# Unicode case folding.
 CAMPAIGN_ID_PATTERN = (
     f"{app_label}.campaign",
-    re.compile(r"(?P<slug>C[0-9]+)", re.I),
+    re.compile(r"(?P<slug>C[0-9]+)", re.I | re.A),
 )
 DATASOURCE_ID_PATTERN = (
     f"{app_label}.datasource",
-    re.compile(r"(?P<slug>DS[0-9]+)", re.I),
+    re.compile(r"(?P<slug>DS[0-9]+)", re.I | re.A),
 )
 GROUP_ID_PATTERN = (
     f"{app_label}.group",
-    re.compile(r"(?P<slug>G[0-9]+)", re.I),
+    re.compile(r"(?P<slug>G[0-9]+)", re.I | re.A),
 )
 MATRIX_ID_PATTERN = (
     f"{app_label}.matrix",
-    re.compile(r"(?P<slug>[-a-z0-9]+)", re.I),
+    re.compile(r"(?P<slug>[-a-z0-9]+)", re.I | re.A),
 )
 MITIGATION_ID_PATTERN = (
     f"{app_label}.mitigation",
-    re.compile(r"(?P<slug>M[0-9]+)", re.I),
+    re.compile(r"(?P<slug>M[0-9]+)", re.I | re.A),
 )
 SOFTWARE_ID_PATTERN = (
     f"{app_label}.software",
-    re.compile(r"(?P<slug>S[0-9]+)", re.I),
+    re.compile(r"(?P<slug>S[0-9]+)", re.I | re.A),
 )
 TACTIC_ID_PATTERN = (
     f"{app_label}.tactic",
-    re.compile(r"(?P<slug>TA[0-9]+)", re.I),
+    re.compile(r"(?P<slug>TA[0-9]+)", re.I | re.A),
 )
 TECHNIQUE_ID_PATTERN = (
     f"{app_label}.technique",
-    re.compile(r"(?P<slug>T[.0-9]+)", re.I),
+    re.compile(r"(?P<slug>T[.0-9]+)", re.I | re.A),
 )
 
 MATCHABLE_MODEL_PATTERNS = (
@@ -35,10 +35,9 @@ for model_name, regex_pk_pattern in VIEWABLE_MODELS_AND_PK_PATTERNS:
     urlpatterns += [
         path(
             f"{model._meta.model_name}/",
-            #: regex_pk_pattern is an re.compile object; pull out the pattern
             include(
                 produce_paths_for_model(
-                    model, regex_pk_pattern.pattern, default_filterset_class=MitreAttackFilterSet
+                    model, regex_pk_pattern, default_filterset_class=MitreAttackFilterSet
                 )
             ),
         ),
@@ -60,8 +59,8 @@ urlpatterns.extend(
 
 # Redirect to the correct model view based on the mitre id
 urlpatterns.append(
-    re_path(
-        r"^redirect-id/(?P<mitre_id>[\w.]+)/",
+    path(
+        "redirect-id/<mitreid:mitre_id>/",
         views.redirect_by_id,
         name="redirect_by_mitre_id",
     )
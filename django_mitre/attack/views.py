@@ -11,13 +11,21 @@ from . import models
 from .utils import get_model_by_id
 
 
+#: Matches the lowercase identifier prefix needing canonicalization.
+_ID_PREFIX_RE = re.compile(r"^[a-z]{1,2}")
+
+
+def _upper_prefix(match: re.Match) -> str:
+    return match.group(0).upper()
+
+
 def redirect_by_id(request, mitre_id):
     model = get_model_by_id(mitre_id)
     if model is None:
         return HttpResponseBadRequest("No model found for this id scheme")
     else:
         #: Adjust the identifier to its canonical form.
-        mitre_id = re.sub("^([a-z]{1,2})", lambda m: m.group(0).upper(), mitre_id)
+        mitre_id = _ID_PREFIX_RE.sub(_upper_prefix, mitre_id)
         return redirect(reverse(model_url_name(model, "detail"), args=[mitre_id]))
 
 
@@ -68,9 +76,13 @@ class MatrixDetailView(BaseDetailView):
 
     def get_ordered_tactics(self):
         if not hasattr(self, "_ordered_tactics"):
-            self._ordered_tactics = self.object.tactic_set.order_by(
-                "order_weight"
-            ).prefetch_related(prefetch_nested_techniques(models.Technique))
+            # Materialized as a list, because the template iterates
+            # the tactics more than once (header and body rows).
+            self._ordered_tactics = list(
+                self.object.tactic_set.order_by("order_weight")
+                .only("mitre_id", "name", "order_weight")
+                .prefetch_related(prefetch_nested_techniques(models.Technique))
+            )
         return self._ordered_tactics
 
     def get_title(self):
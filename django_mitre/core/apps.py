@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from django.apps import AppConfig
+from django.urls import register_converter
 
 
 HERE = Path(__file__).parent
@@ -11,3 +12,8 @@ class MitreAttackConfig(AppConfig):
     label = "mitrecore"
     name = "django_mitre.core"
     path = HERE
+
+    def ready(self):
+        from .converters import MitreIdConverter
+
+        register_converter(MitreIdConverter, "mitreid")
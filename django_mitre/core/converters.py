@@ -0,0 +1,29 @@
+"""
+URL path converters for mitre content.
+
+Registered by the core app config so that app URLconfs
+can use them in ``path()`` routes.
+"""
+
+
+class MitreIdConverter:
+    """
+    Matches a MITRE identifier (e.g. ``T1059.001`` or ``B0030.001``).
+
+    Declared as a ``path()`` converter so the route takes part in the
+    resolver's combined matching, rather than being an individually
+    scanned ``re_path`` entry.
+
+    The character class is spelled out (rather than ``\\w``) because
+    identifiers are ASCII-only; this keeps the match off the Unicode
+    word-character tables. Lowercase is accepted, because the redirect
+    views canonicalize the letter prefix.
+    """
+
+    regex = r"[A-Za-z0-9.]+"
+
+    def to_python(self, value: str) -> str:
+        return value
+
+    def to_url(self, value: str) -> str:
+        return value
@@ -4,6 +4,22 @@ from django.shortcuts import reverse
 from .utils import model_url_name
 
 
+def active_partial_index(name: str) -> models.Index:
+    """
+    Produce a partial index over ``mitre_id`` covering only the active
+    (non-deprecated, non-revoked) records.
+
+    The index listings always filter on this pair,
+    so the planner can satisfy them from the narrow partial index
+    instead of scanning the full table.
+    """
+    return models.Index(
+        fields=["mitre_id"],
+        condition=models.Q(deprecated=False, revoked=False),
+        name=name,
+    )
+
+
 class MitreIdentifiableMixIn(models.Model):
     # Note, there are records that have the same mitre_id,
     # but different a different stix id.
@@ -12,10 +12,12 @@ def ordered_table_header(context, title, field_name):
     query_params = context.request.GET
     current_value = query_params.get("order")
 
+    # This renders once per column header on every index page,
+    # so only build the descending value when it is actually needed.
     if current_value == field_name:
         sort_order = "asc"
         next_sort_order_value = f"-{field_name}"
-    elif current_value == f"-{field_name}":
+    elif current_value and current_value[0] == "-" and current_value[1:] == field_name:
         sort_order = "desc"
         next_sort_order_value = ""  # nullified
     else:
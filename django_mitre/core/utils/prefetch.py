@@ -12,9 +12,16 @@ def prefetch_nested_techniques(technique_model):
 
     # https://docs.djangoproject.com/en/4.2/ref/models/querysets/#prefetch-related
 
-    qs_active_techniques = technique_model.objects.get_active()
-    qs_active_major_techniques = technique_model.objects.get_active().filter(
-        is_subtechnique=False
+    # Only load the columns the matrix rendering touches
+    # (identifier, name, platform filter values) to keep row width down.
+    # `major_technique` is required to relate prefetched subtechniques.
+    qs_active_techniques = technique_model.objects.get_active().only(
+        "mitre_id", "name", "platforms", "is_subtechnique", "major_technique"
+    )
+    qs_active_major_techniques = (
+        technique_model.objects.get_active()
+        .filter(is_subtechnique=False)
+        .only("mitre_id", "name", "platforms", "is_subtechnique")
     )
 
     prefetch_subtechniques = Prefetch(
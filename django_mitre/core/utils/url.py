@@ -1,5 +1,6 @@
+import re
 from collections.abc import Callable
-from functools import partial
+from functools import cache, lru_cache, partial
 from importlib import import_module
 
 from django.conf import settings
@@ -16,6 +17,7 @@ from .model import model_url_name
 
 __all__ = [
     "get_view_class_name",
+    "lazy_include",
     "path",
     "produce_paths_for_model",
     "re_path",
@@ -37,6 +39,7 @@ def default_view_wrapper(
     return view
 
 
+@lru_cache(maxsize=1)
 def get_view_wrapper() -> Callable:
     """
     Returns a callable wrapper function that enables the developer extending this package
@@ -46,6 +49,10 @@ def get_view_wrapper() -> Callable:
     The view wrapper, registered with the ``DJANGO_MITRE_VIEW_WRAPPER`` setting
     takes a ``view`` argument and ``model``, ``name``, and ``url_name`` keyword arguments.
 
+    Cached for the life of the process, because ``_path`` resolves the
+    wrapper for every registered URL and the setting lookup
+    (and possible ``import_string``) is not free.
+
     """
     wrapper = getattr(settings, 'DJANGO_MITRE_VIEW_WRAPPER', default_view_wrapper)
     if isinstance(wrapper, str):
@@ -68,13 +75,20 @@ def gracefully_import_module(name, package=None, default=None):
         return default
 
 
-def produce_paths_for_model(
-    model,
-    pk_pattern,
-    IndexView=BaseIndexView,
-    FilterView=FilterView,
-    default_filterset_class=MitreFilterSet,
-):
+@cache
+def _default_filterset_class(model, base_cls):
+    """
+    Produce (and cache) a filterset class for the model.
+
+    ``filterset_factory`` walks the model's fields through the filterset
+    metaclass, which is expensive enough to avoid repeating when the
+    URLconf is (re)loaded (e.g. tests, dev autoreload).
+    """
+    return filterset_factory(model=model, base_cls=base_cls)
+
+
+@cache
+def _produce_paths_for_model(model, pk_pattern, IndexView, FilterView, default_filterset_class):
     # Find supporting modules
     #: Don't assume the app has a `filters` module.
     app_config = model._meta.app_config
@@ -90,10 +104,7 @@ def produce_paths_for_model(
     # Get or create the filterset class.
     filterset_class = getattr(app_filters, f"{model.__name__}FilterSet", None)
     if filterset_class is None:
-        filterset_class = filterset_factory(
-            model=model,
-            base_cls=default_filterset_class,
-        )
+        filterset_class = _default_filterset_class(model, default_filterset_class)
 
     # Create views
     filter_view = FilterView.as_view(model=model, filterset_class=filterset_class)
@@ -108,6 +119,53 @@ def produce_paths_for_model(
     return paths
 
 
+def produce_paths_for_model(
+    model,
+    pk_pattern,
+    IndexView=BaseIndexView,
+    FilterView=FilterView,
+    default_filterset_class=MitreFilterSet,
+):
+    #: Accept a precompiled pattern (e.g. from a `patterns` module) as-is;
+    #: the pattern source is only needed to compose the detail route.
+    #: Normalized here so both call forms share a cache entry.
+    if isinstance(pk_pattern, re.Pattern):
+        pk_pattern = pk_pattern.pattern
+    return _produce_paths_for_model(model, pk_pattern, IndexView, FilterView,
+                                    default_filterset_class)
+
+
+class LazyInclude:
+    """
+    Holds a factory for a URL subtree and only invokes it when the
+    resolver asks for the ``urlpatterns`` attribute.
+    """
+
+    def __init__(self, factory: Callable):
+        self._factory = factory
+        self._cache = None
+
+    @property
+    def urlpatterns(self):
+        if self._cache is None:
+            self._cache = self._factory()
+        return self._cache
+
+
+def lazy_include(factory: Callable) -> tuple:
+    """
+    An ``include()`` substitute that defers building the included
+    ``urlpatterns`` until the resolver first descends into the subtree.
+
+    ``django.urls.include`` reads ``urlpatterns`` eagerly for its
+    configuration checks, which would force the build at import time.
+    Returning the ``(urlconf_module, app_name, namespace)`` triple
+    directly keeps the deferral intact,
+    because ``URLResolver.url_patterns`` is evaluated lazily.
+    """
+    return (LazyInclude(factory), None, None)
+
+
 def _path(
     route: str,
     view: Callable | list | tuple,
@@ -5,10 +5,12 @@ Base views for mitre content
 
 import json
 from collections.abc import Generator
-from urllib.parse import urlencode
+from functools import cache
+from urllib.parse import quote_plus
 
 from django import forms
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 from django.utils.decorators import classonlymethod
@@ -20,18 +22,118 @@ from ..forms import FilterForm
 from ..utils import model_fields, model_url_name
 
 
+#: Reusable encoder for filter query data; compact separators keep the
+#: resulting query strings short.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+@cache
+def _reverse_model_url(model_label: str, action: str) -> str:
+    """
+    Reverse the conventional URL for the given model label and action
+    (e.g. ``('mitreattack.technique', 'index')``).
+
+    Cached because the URLconf is static after startup,
+    while ``reverse`` walks the resolver on every call.
+    """
+    return reverse(model_url_name(model_label, action))
+
+
+@cache
+def _model_title(model) -> str:
+    """
+    Produce (and cache) the title-cased plural verbose name for the model.
+
+    ``verbose_name_plural`` is a lazy translatable string,
+    so ``.title()`` re-evaluates it on every access without caching.
+    """
+    return model._meta.verbose_name_plural.title()
+
+
+@cache
+def _model_fields(model, fields: tuple):
+    """
+    Cached variant of ``model_fields`` for per-request use.
+
+    Keyed on the model and the listed field names,
+    both of which are stable for the life of the process.
+    """
+    return tuple(model_fields(model, list(fields)))
+
+
+@cache
+def _related_field_names(model, fields: tuple) -> tuple[tuple, tuple]:
+    """
+    Split the listed field names into ``select_related`` and
+    ``prefetch_related`` candidates for the model.
+
+    Forward one-to-one and many-to-one relations can be joined in,
+    while many-to-many relations need a prefetch.
+    Non-relational (and non-model) names are ignored.
+    """
+    select, prefetch = [], []
+    for name in fields:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if not field.is_relation:
+            continue
+        if field.many_to_one or field.one_to_one:
+            select.append(name)
+        else:
+            prefetch.append(name)
+    return tuple(select), tuple(prefetch)
+
+
+@cache
+def _filterset_schemas(filterset_class) -> tuple[str, str]:
+    """
+    Serialize (and cache) the filtering options and JSON schemas
+    for the given filterset class.
+
+    The schemas only depend on the class definition,
+    so there is no need to re-serialize them per request.
+    """
+    filterset = filterset_class()
+    return (str(filterset.filtering_options_schema), str(filterset.json_schema))
+
+
+@cache
+def _flat_filtering_form_class(filterset_class, hidden_fields: tuple):
+    """
+    Build (and cache) the flat filtering form class
+    for the given filterset class and hidden fields.
+
+    Form class construction runs through the form metaclass,
+    which is too expensive to repeat on every request.
+    """
+    return flat_filtering_form_factory(filterset_class, hidden_fields=list(hidden_fields))
+
+
+@cache
+def _template_names(model, template_filename: str) -> list[str]:
+    """
+    Produce (and cache) the template name candidates for the model.
+
+    Keyed on the model rather than the view class,
+    because the model is regularly supplied through ``as_view(model=...)``.
+    """
+    model_app_label = model._meta.app_label
+    model_name = model._meta.model_name
+    return [
+        f"{model_app_label}/{model_name}/{template_filename}",
+        f"{model_app_label}/{template_filename}",
+        # default to the mitrecore template
+        f"mitrecore/{template_filename}",
+    ]
+
+
 class UseMitreCoreTemplatesMixin:
     template_filename = None
 
     def get_template_names(self):
-        model_app_label = self.model._meta.app_label
-        model_name = self.model._meta.model_name
-        return [
-            f"{model_app_label}/{model_name}/{self.template_filename}",
-            f"{model_app_label}/{self.template_filename}",
-            # default to the mitrecore template
-            f"mitrecore/{self.template_filename}",
-        ]
+        return _template_names(self.model, self.template_filename)
 
 
 class FlatFilteringFormViewMixin(FormMixin):
@@ -39,11 +141,20 @@ class FlatFilteringFormViewMixin(FormMixin):
     flat_filtering_form_hidden_fields = ["collection*"]
 
     def get_form_class(self):
-        return flat_filtering_form_factory(
+        return _flat_filtering_form_class(
             self.filterset_class,
-            hidden_fields=self.flat_filtering_form_hidden_fields,
+            tuple(self.flat_filtering_form_hidden_fields),
         )
 
+    def get_form(self, form_class=None):
+        # Memoize the default form; it is requested by both the POST
+        # handling and the template's filter header row.
+        if form_class is None:
+            if not hasattr(self, "_form"):
+                self._form = super().get_form()
+            return self._form
+        return super().get_form(form_class)
+
     def post(self, request, *args, **kwargs):
         form = self.get_form()
         if form.is_valid():
@@ -62,13 +173,9 @@ class FlatFilteringFormViewMixin(FormMixin):
         return super().form_valid(form)
 
     def get_success_url(self):
-        url = reverse(model_url_name(self.model, "index"))
-        qs = urlencode(
-            {
-                "q": json.dumps(self.form.filterset.query_data),
-            }
-        )
-        return f"{url}?{qs}"
+        url = _reverse_model_url(self.model._meta.label, "index")
+        q = quote_plus(_JSON_ENCODER.encode(self.form.filterset.query_data))
+        return f"{url}?q={q}"
 
 
 class BaseIndexView(UseMitreCoreTemplatesMixin, FlatFilteringFormViewMixin, ListView):
@@ -92,13 +199,18 @@ class BaseIndexView(UseMitreCoreTemplatesMixin, FlatFilteringFormViewMixin, List
         return super().as_view(**initkwargs)
 
     def get_model_fields(self):
-        return model_fields(self.model, self.fields)
+        return _model_fields(self.model, tuple(self.fields))
 
     def get_filter_form_fields(self) -> Generator[forms.Field | None, None, None]:
-        form = self.get_form()
+        cls = type(self)
+        field_order = cls.__dict__.get("_form_field_order")
+        if field_order is None:
+            # The ordering only depends on class attributes; compute it once.
+            field_order = tuple(cls.fields_to_form_field[field] for field in cls.fields)
+            cls._form_field_order = field_order
 
-        for field in self.fields:
-            form_field_name = self.fields_to_form_field[field]
+        form = self.get_form()
+        for form_field_name in field_order:
             if not form_field_name:
                 yield None
             else:
@@ -107,47 +219,63 @@ class BaseIndexView(UseMitreCoreTemplatesMixin, FlatFilteringFormViewMixin, List
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["title"] = self.get_title()
-        context["listing_url"] = reverse(model_url_name(self.model, "index"))
-        context["filtering_url"] = reverse(model_url_name(self.model, "filter"))
+        context["listing_url"] = _reverse_model_url(self.model._meta.label, "index")
+        context["filtering_url"] = _reverse_model_url(self.model._meta.label, "filter")
 
         context["filter_url_name"] = model_url_name(self.model, "filter")
+        # `get_filters` is memoized, so this reuses the parse already
+        # done for the queryset filtering rather than re-validating.
         context["is_filtered"] = bool(self.get_filters())
-        filterset = self.get_filterset()
-        context["filtering_options_schema"] = str(filterset.filtering_options_schema)
-        context["filtering_json_schema"] = str(filterset.json_schema)
+        options_schema, json_schema = _filterset_schemas(self.get_filterset_class())
+        context["filtering_options_schema"] = options_schema
+        context["filtering_json_schema"] = json_schema
         context["DEBUG"] = "true" if settings.DEBUG else "false"  # js true/false value
         return context
 
     def get_filters(self):
-        form = FilterForm(self.request.GET)
-        if not form.is_valid():
-            raise Exception(f"Ran into form validation error? {form.errors}")
-        q = form.cleaned_data["q"]
-        return q if q else []
+        if not hasattr(self, "_filters"):
+            if "q" not in self.request.GET:
+                # No filter criteria supplied; skip validation entirely.
+                self._filters = []
+            else:
+                # Only the 'q' value is of interest here,
+                # so clean it directly rather than constructing
+                # and validating a full FilterForm.
+                try:
+                    q = FilterForm.base_fields["q"].clean(self.request.GET["q"])
+                except forms.ValidationError as exc:
+                    raise Exception(f"Ran into form validation error? {exc.messages}") from exc
+                self._filters = q if q else []
+        return self._filters
 
     def get_filterset_class(self):
         return self.filterset_class
 
     def get_filterset(self):
-        filterset_class = self.get_filterset_class()
-        return filterset_class(self.get_filters()) if filterset_class else None
+        # Memoized, because this is needed by the form, the queryset,
+        # and the context data within a single request.
+        if not hasattr(self, "_filterset"):
+            filterset_class = self.get_filterset_class()
+            self._filterset = filterset_class(self.get_filters()) if filterset_class else None
+        return self._filterset
 
     def filter_queryset(self, queryset):
-        filterset_cls = self.get_filterset_class()
-        if filterset_cls is None:
+        if not self.get_filters():
             return queryset
 
-        filter_data = self.get_filters()
-        if not filter_data:
+        filterset = self.get_filterset()
+        if filterset is None:
             return queryset
-
-        filterset = filterset_cls(filter_data)
         return filterset.filter_queryset(queryset)
 
     def get_ordering(self):
+        cls = type(self)
+        fields_set = cls.__dict__.get("_fields_set")
+        if fields_set is None:
+            fields_set = cls._fields_set = frozenset(cls.fields)
         # Only allow to order by one field at a time.
         field_name = self.request.GET.get("order")
-        if field_name and field_name.strip("-") not in self.fields:
+        if field_name and field_name.lstrip("-") not in fields_set:
             return None
         return field_name
 
@@ -155,16 +283,33 @@ class BaseIndexView(UseMitreCoreTemplatesMixin, FlatFilteringFormViewMixin, List
         queryset = super().get_queryset()
         # Filter out all deprecated and revoked content
         queryset = queryset.filter(deprecated=False, revoked=False)
+        # Eagerly load the listed relations (e.g. `collection`)
+        # to avoid a query per row when the table renders them.
+        select, prefetch = _related_field_names(self.model, tuple(self.fields))
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
         # Filter using user supplied criteria
         queryset = self.filter_queryset(queryset)
         return queryset
 
     def get_title(self):
-        return self.model._meta.verbose_name_plural.title()
+        return _model_title(self.model)
 
 
 class BaseDetailView(UseMitreCoreTemplatesMixin, DetailView):
     template_filename = "detail.html"
+    #: Wide columns that detail templates never render;
+    #: deferred to keep the fetched row narrow.
+    #: Subclasses needing one of these can override the list.
+    deferred_fields = ["mitre_original_data"]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.deferred_fields:
+            queryset = queryset.defer(*self.deferred_fields)
+        return queryset
 
     def get_object(self, queryset=None):
         # Try getting the object without specific filtering
@@ -210,11 +355,9 @@ class FilterView(UseMitreCoreTemplatesMixin, FormView):
         return self.form_class
 
     def form_valid(self, form):
-        querystring = urlencode({"q": json.dumps(form.cleaned_data["q"])})
-        url = reverse(model_url_name(self.model, "index"))
-        if querystring:
-            url = f"{url}?{querystring}"
-        return HttpResponseRedirect(url)
+        url = _reverse_model_url(self.model._meta.label, "index")
+        q = quote_plus(_JSON_ENCODER.encode(form.cleaned_data["q"]))
+        return HttpResponseRedirect(f"{url}?q={q}")
 
     def get_form_kwargs(self):
         """Return the keyword arguments for instantiating the form."""
@@ -240,22 +383,18 @@ class FilterView(UseMitreCoreTemplatesMixin, FormView):
     def get_filterset_class(self):
         return self.filterset_class
 
-    def get_filterset(self, form):
-        filterset = self.get_filterset_class()(form.cleaned_data["q"])
-        return filterset
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["listing_url"] = reverse(model_url_name(self.model, "index"))
-        context["filtering_url"] = reverse(model_url_name(self.model, "filter"))
+        context["listing_url"] = _reverse_model_url(self.model._meta.label, "index")
+        context["filtering_url"] = _reverse_model_url(self.model._meta.label, "filter")
 
         form = context["form"]
         form.is_valid()
-        filterset = self.get_filterset(form)
-        context["filtering_options_schema"] = str(filterset.filtering_options_schema)
-        context["filtering_json_schema"] = str(filterset.json_schema)
+        options_schema, json_schema = _filterset_schemas(self.get_filterset_class())
+        context["filtering_options_schema"] = options_schema
+        context["filtering_json_schema"] = json_schema
         context["DEBUG"] = "true" if settings.DEBUG else "false"  # js true/false value
         return context
 
     def get_title(self):
-        return f"Filter {self.model._meta.verbose_name_plural.title()}"
+        return f"Filter {_model_title(self.model)}"
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.17 on 2026-08-30 11:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mitrembc', '0004_auto_20240606_0143'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='software',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='mbc_software_active',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='tactic',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='mbc_tactic_active',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='technique',
+            index=models.Index(
+                condition=models.Q(('deprecated', False), ('revoked', False)),
+                fields=['mitre_id'],
+                name='mbc_technique_active',
+            ),
+        ),
+    ]
@@ -6,7 +6,7 @@ from django.db import models
 from django.db.models.signals import pre_save
 from django.dispatch import receiver
 
-from ..core.models import MitreIdentifiableMixIn
+from ..core.models import MitreIdentifiableMixIn, active_partial_index
 
 
 __all__ = (
@@ -129,6 +129,7 @@ class Software(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
     class Meta:
         verbose_name = "malware"
         verbose_name_plural = "malware"
+        indexes = [active_partial_index("mbc_software_active")]
 
 
 class Technique(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
@@ -166,6 +167,7 @@ class Technique(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
 
     class Meta:
         verbose_name = "behavior"
+        indexes = [active_partial_index("mbc_technique_active")]
 
 
 class Reference(BaseModel):
@@ -249,6 +251,7 @@ class Tactic(BaseModel, DescriptiveMixIn, MitreIdentifiableMixIn):
 
     class Meta:
         verbose_name = "objective"
+        indexes = [active_partial_index("mbc_tactic_active")]
 
 
 ALL_MODELS = (
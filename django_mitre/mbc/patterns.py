@@ -15,21 +15,24 @@ app_label = "mitrembc"
 # However, they are written for case exact matching in view url registration,
 # because we don't absolutely know that MITRE won't change to a character
 # case-sensitive identifier scheme.
+# Identifiers are ASCII-only, so `re.A` is set to keep the
+# case-insensitive matching on the ASCII tables rather than the full
+# Unicode case folding.
 MATRIX_ID_PATTERN    = (
     f"{app_label}.matrix",
-    re.compile(r"(?P<slug>[-a-z0-9]+)", re.I),
+    re.compile(r"(?P<slug>[-a-z0-9]+)", re.I | re.A),
 )
 SOFTWARE_ID_PATTERN  = (
     f"{app_label}.software",
-    re.compile(r"(?P<slug>X[0-9]+)", re.I),
+    re.compile(r"(?P<slug>X[0-9]+)", re.I | re.A),
 )
 TACTIC_ID_PATTERN    = (
     f"{app_label}.tactic",
-    re.compile(r"(?P<slug>(OB|OC){1}[0-9]+)", re.I),
+    re.compile(r"(?P<slug>(OB|OC){1}[0-9]+)", re.I | re.A),
 )
 TECHNIQUE_ID_PATTERN = (
     f"{app_label}.technique",
-    re.compile(r"(?P<slug>[BCEF]{1}[.0-9m]+)", re.I),
+    re.compile(r"(?P<slug>[BCEF]{1}[.0-9m]+)", re.I | re.A),
 )
 
 MATCHABLE_MODEL_PATTERNS = (
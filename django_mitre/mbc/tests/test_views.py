@@ -3,7 +3,81 @@ from django.urls import reverse
 from model_bakery import baker
 
 from ...core.utils import model_url_name
-from ..models import Software
+from ..models import Software, Tactic, Technique
+
+
+#: One example id per prefix class handled by `views.redirect_by_id`,
+#: to keep its prefix table honest against `patterns.py`.
+EXAMPLE_IDS_TO_MODELS = (
+    ("X0004", Software),
+    ("OB0001", Tactic),
+    ("OC0002", Tactic),
+    ("B0030", Technique),
+    ("C0011", Technique),
+    ("E1027", Technique),
+    ("F0001", Technique),
+)
+
+
+class RedirectByIdTestCase(TestCase):
+    fixtures = [
+        "tests/mitreattack/auth_user.json",
+    ]
+
+    def setUp(self):
+        # Only need to be authenticated to use this route
+        self.client.login(username="nobody", password="password")
+
+    def test_model_redirects(self):
+        for id, model in EXAMPLE_IDS_TO_MODELS:
+            with self.subTest(id=id, model=model):
+                url = reverse("mitrembc:redirect_by_mitre_id", args=[id])
+                resp = self.client.get(url)
+
+                expected_redirect_url = reverse(
+                    model_url_name(model, "detail"),
+                    args=[id],
+                )
+                self.assertEqual(resp.url, expected_redirect_url)
+
+    def test_no_matching_id(self):
+        for id in (
+            "bogus",
+            "A7070",
+        ):
+            url = reverse("mitrembc:redirect_by_mitre_id", args=[id])
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, 400)
+
+    def test_lowercase_id(self):
+        examples = [
+            # Format: (<id>, <canonical-id>, <model>,)
+            # Common case identifier with single letter and extended sub-id
+            (
+                "b0030.001",
+                "B0030.001",
+                Technique,
+            ),
+            # Double char prefixed id
+            (
+                "ob0001",
+                "OB0001",
+                Tactic,
+            ),
+        ]
+        for (
+            id_,
+            canonical_id,
+            model,
+        ) in examples:
+            with self.subTest(id=id_, canonical_id=canonical_id, model=model):
+                url = reverse("mitrembc:redirect_by_mitre_id", args=[id_])
+                resp = self.client.get(url)
+                # Check that we redirect for lowercase identifiers
+                self.assertEqual(resp.status_code, 302)
+                # Check the redirect location uses the canonical id
+                url = reverse(model_url_name(model, "detail"), args=[canonical_id])
+                self.assertEqual(resp.headers["location"], url)
 
 
 class BaseDetailViewTestCase(TestCase):
@@ -1,7 +1,7 @@
-from django.apps import apps
-from django.urls import include
+import sys
+from functools import partial
 
-from ..core.utils import path, produce_paths_for_model, re_path
+from ..core.utils import lazy_include, path, produce_paths_for_model
 from ..core.views import AppIndexView
 from . import models, patterns, views
 
@@ -15,38 +15,58 @@ urlpatterns = [
         name="index",
     ),
     # Matrix
+    # Registered as "matrix_index": the `model` kwarg makes the core
+    # `path` wrapper prefix the name via `model_url_name`, so this does
+    # not shadow the app index above and `reverse()` stays a single
+    # dict lookup for each.
     path(
         "matrix/",
         views.MatrixIndexView.as_view(),
         name="index",
         model=models.Matrix,
     ),
+    # Redirect to the correct model view based on the mitre id.
+    # Registered ahead of the per-model subtrees so this high-traffic
+    # entry point resolves without descending into them.
+    path(
+        "redirect-id/<mitreid:mitre_id>/",
+        views.redirect_by_id,
+        name="redirect_by_mitre_id",
+    ),
 ]
 
-VIEWABLE_MODELS_AND_PK_PATTERNS = (
-    # [<model>, <pattern>],
-    # patterns.MATRIX_ID_PATTERN,  # Matrix is special
-    patterns.SOFTWARE_ID_PATTERN,
-    patterns.TACTIC_ID_PATTERN,
-    patterns.TECHNIQUE_ID_PATTERN,
-)
+# Each model subtree is mounted under its unique `<model_name>/` prefix;
+# the resolver skips an entire include when its prefix does not match,
+# so keep these prefixes distinct and non-overlapping.
+# Deliberately kept as separate named subtrees (not a single combined
+# alternation with a dispatching view): the per-model url names are what
+# `reverse()`/`model_url_name` rely on throughout the package.
+# Matrix is special; see the `matrix/` route above.
+# Prefixes are interned so the resolver's repeated comparisons can
+# short-circuit on identity; each subtree build is deferred until a
+# request first reaches it.
+_, SOFTWARE_PK_PATTERN = patterns.SOFTWARE_ID_PATTERN
+_, TACTIC_PK_PATTERN = patterns.TACTIC_ID_PATTERN
+_, TECHNIQUE_PK_PATTERN = patterns.TECHNIQUE_ID_PATTERN
 
-for model_name, regex_pk_pattern in VIEWABLE_MODELS_AND_PK_PATTERNS:
-    model = apps.get_model(model_name)
-    urlpatterns += [
+urlpatterns.extend(
+    (
         path(
-            f"{model._meta.model_name}/",
-            #: regex_pk_pattern is an re.compile object; pull out the pattern
-            include(produce_paths_for_model(model, regex_pk_pattern.pattern)),
+            sys.intern("software/"),
+            lazy_include(partial(produce_paths_for_model, models.Software, SOFTWARE_PK_PATTERN)),
+        ),
+        path(
+            sys.intern("tactic/"),
+            lazy_include(partial(produce_paths_for_model, models.Tactic, TACTIC_PK_PATTERN)),
+        ),
+        path(
+            sys.intern("technique/"),
+            lazy_include(
+                partial(produce_paths_for_model, models.Technique, TECHNIQUE_PK_PATTERN)
+            ),
         ),
-    ]
-
-
-# Redirect to the correct model view based on the mitre id
-urlpatterns.append(
-    re_path(
-        r"^redirect-id/(?P<mitre_id>[\w.]+)/",
-        views.redirect_by_id,
-        name="redirect_by_mitre_id",
     )
 )
+
+# Frozen after construction; the resolver only ever iterates these.
+urlpatterns = tuple(urlpatterns)
@@ -7,18 +7,42 @@ from django.urls import reverse
 from ..core.utils.model import model_url_name
 from ..core.utils.prefetch import prefetch_nested_techniques
 from ..core.views.base import BaseDetailView
-from . import models
-from .utils import get_model_by_id
+from . import models, patterns
+
+
+#: Matches the lowercase identifier prefix needing canonicalization.
+_ID_PREFIX_RE = re.compile(r"^[a-z]{1,2}")
+
+
+def _upper_prefix(match: re.Match) -> str:
+    return match.group(0).upper()
+
+
+#: Maps the canonical identifier letter prefix to its model and
+#: compiled id pattern, so the redirect view jumps straight to the one
+#: pattern to validate instead of scanning them all.
+_ID_PREFIX_TO_MODEL_PATTERN = {
+    "X": (models.Software, patterns.SOFTWARE_ID_PATTERN[1]),
+    "OB": (models.Tactic, patterns.TACTIC_ID_PATTERN[1]),
+    "OC": (models.Tactic, patterns.TACTIC_ID_PATTERN[1]),
+    "B": (models.Technique, patterns.TECHNIQUE_ID_PATTERN[1]),
+    "C": (models.Technique, patterns.TECHNIQUE_ID_PATTERN[1]),
+    "E": (models.Technique, patterns.TECHNIQUE_ID_PATTERN[1]),
+    "F": (models.Technique, patterns.TECHNIQUE_ID_PATTERN[1]),
+}
 
 
 def redirect_by_id(request, mitre_id):
-    model = get_model_by_id(mitre_id)
-    if model is None:
+    #: Adjust the identifier to its canonical form.
+    mitre_id = _ID_PREFIX_RE.sub(_upper_prefix, mitre_id)
+    entry = (
+        _ID_PREFIX_TO_MODEL_PATTERN.get(mitre_id[:2])
+        or _ID_PREFIX_TO_MODEL_PATTERN.get(mitre_id[:1])
+    )
+    if entry is None or not entry[1].match(mitre_id):
         return HttpResponseBadRequest("No model found for this id scheme")
-    else:
-        #: Adjust the identifier to its canonical form.
-        mitre_id = re.sub("^([a-z]{1,2})", lambda m: m.group(0).upper(), mitre_id)
-        return redirect(reverse(model_url_name(model, "detail"), args=[mitre_id]))
+    model, _ = entry
+    return redirect(reverse(model_url_name(model, "detail"), args=[mitre_id]))
 
 
 class TechniqueDetailView(BaseDetailView):